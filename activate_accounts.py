@@ -5,51 +5,64 @@ This ensures accounts are rent-exempt and active on-chain
 """
 
 import asyncio
-import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from solders.hash import Hash
+from solders.instruction import Instruction
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
-from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
+from solana.rpc.commitment import Processed
 from solders.system_program import transfer, TransferParams
 from solders.transaction import VersionedTransaction
 from solders.message import MessageV0
 
+# Add agent_output to path
+sys.path.insert(0, str(Path(__file__).parent / "agent_output"))
 
-async def activate_account(keypair: Keypair, client: AsyncClient):
-    """Send a small self-transfer to activate the account"""
-    print(f"\nActivating account: {keypair.pubkey()}")
-    
-    # Get latest blockhash
-    latest_blockhash = await client.get_latest_blockhash()
-    
-    # Create self-transfer (0.001 SOL to self)
-    transfer_ix = transfer(
+from utils import SolanaClient, load_keypair
+
+
+@lru_cache(maxsize=None)
+def _self_transfer_instruction(pubkey: Pubkey, lamports: int) -> Instruction:
+    """Self-transfer instruction; it only depends on the account, so build it once"""
+    return transfer(
         TransferParams(
-            from_pubkey=keypair.pubkey(),
-            to_pubkey=keypair.pubkey(),
-            lamports=1_000_000  # 0.001 SOL
+            from_pubkey=pubkey,
+            to_pubkey=pubkey,
+            lamports=lamports
         )
     )
-    
-    # Create message
+
+
+def build_self_transfer(keypair: Keypair, blockhash: Hash, lamports: int = 1_000_000) -> VersionedTransaction:
+    """Build and sign a self-transfer (default 0.001 SOL) against `blockhash`"""
     message = MessageV0.try_compile(
         payer=keypair.pubkey(),
-        instructions=[transfer_ix],
+        instructions=[_self_transfer_instruction(keypair.pubkey(), lamports)],
         address_lookup_table_accounts=[],
-        recent_blockhash=latest_blockhash.value.blockhash
+        recent_blockhash=blockhash
     )
+    return VersionedTransaction(message, [keypair])
+
+
+async def activate_account(keypair: Keypair, client: SolanaClient):
+    """Send a small self-transfer to activate the account"""
+    print(f"\nActivating account: {keypair.pubkey()}")
     
-    # Create and sign transaction
-    transaction = VersionedTransaction(message, [keypair])
+    # Build the self-transfer against the cached blockhash
+    transaction = build_self_transfer(keypair, await client.get_cached_blockhash())
     
     # Send transaction
     try:
-        response = await client.send_transaction(transaction)
+        response = await client.client.send_transaction(transaction, opts=client.SEND_OPTS)
         signature = str(response.value)
         print(f"Activation transaction sent: {signature}")
         
-        # Wait for confirmation
-        await client.confirm_transaction(response.value, commitment=Confirmed)
+        # Activation only needs the transaction in a block, so wait for
+        # processed rather than the slower confirmed commitment
+        if not await client.wait_for_confirmation(response.value, commitment=Processed):
+            raise Exception("Activation transaction was not confirmed in time")
         print(f"✓ Account activated!")
         return signature
     except Exception as e:
@@ -62,23 +75,22 @@ async def main():
     print("  ACTIVATING ACCOUNTS")
     print("=" * 80)
     
-    # Load wallets
-    with open('wallets/agent_a.json') as f:
-        data = json.load(f)
-        agent_a = Keypair.from_bytes(bytes(data['secret_key']))
-    
-    with open('wallets/agent_b.json') as f:
-        data = json.load(f)
-        agent_b = Keypair.from_bytes(bytes(data['secret_key']))
+    # Load wallets off the event loop
+    agent_a, agent_b = await asyncio.gather(
+        asyncio.to_thread(load_keypair, 'wallets/agent_a.json'),
+        asyncio.to_thread(load_keypair, 'wallets/agent_b.json')
+    )
     
-    client = AsyncClient('https://api.devnet.solana.com')
+    client = SolanaClient('https://api.devnet.solana.com')
     
     try:
-        # Activate both accounts
-        sig_a = await activate_account(agent_a, client)
-        await asyncio.sleep(2)  # Wait a bit between transactions
+        await client.start_blockhash_updater()
         
-        sig_b = await activate_account(agent_b, client)
+        # Activate both accounts concurrently; they share the cached blockhash
+        sig_a, sig_b = await asyncio.gather(
+            activate_account(agent_a, client),
+            activate_account(agent_b, client)
+        )
         
         print("\n" + "=" * 80)
         print("  ACTIVATION COMPLETE")
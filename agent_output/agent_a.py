@@ -9,46 +9,79 @@ Responsibilities:
 """
 
 import asyncio
-import json
-from pathlib import Path
+import hmac
+from typing import List, Optional
 from solders.pubkey import Pubkey
-from utils import WalletManager, SolanaClient, ServiceProvider, print_section
+from utils import WalletManager, SolanaClient, ServiceProvider, print_section, explorer_url, write_json
 
 
 class AgentA:
     """Agent A - Service Requester"""
     
-    def __init__(self, wallet_path: str = "wallets/agent_a.json"):
+    def __init__(self, wallet_path: str = "wallets/agent_a.json", solana_client: Optional[SolanaClient] = None):
         self.wallet_manager = WalletManager(wallet_path)
         self.keypair = None
-        self.solana_client = SolanaClient()
+        # A shared client is owned (and closed) by whoever passed it in
+        self._owns_client = solana_client is None
+        self.solana_client = solana_client or SolanaClient()
         self.agent_b_pubkey = None
         self.transaction_log = []
+        self._airdrop_task: Optional[asyncio.Task] = None
+        self._pending_confirmations: List[asyncio.Task] = []
+        # Local recomputation of each service, used to check Agent B's results
+        self.result_verifiers = {
+            'hash': ServiceProvider.compute_sha256
+        }
+        # Expected results computed at request time, keyed by (service_type, input)
+        self._expected_results = {}
+        # Memos of requests we sent, keyed by signature, so audits need no re-fetch
+        self._request_memos = {}
     
-    async def initialize(self):
-        """Initialize Agent A"""
+    async def initialize(self, balance: Optional[float] = None):
+        """
+        Initialize Agent A
+        
+        Args:
+            balance: Current SOL balance if the caller already fetched it
+        """
         print_section("AGENT A INITIALIZATION")
         
         # Create or load wallet
-        self.keypair = self.wallet_manager.create_or_load()
+        if self.keypair is None:
+            self.keypair = self.wallet_manager.create_or_load()
+        
+        # Keep a recent blockhash warm for outgoing transactions
+        await self.solana_client.start_blockhash_updater()
         
         # Check balance
-        balance = await self.solana_client.get_balance(self.keypair.pubkey())
+        if balance is None:
+            balance = await self.solana_client.get_balance(self.keypair.pubkey())
         print(f"Current balance: {balance} SOL")
         
-        # Request airdrop if balance is low
+        # Request airdrop if balance is low; it completes in the background and
+        # is only awaited once we actually need to spend
         if balance < 1.0:
             print("Balance too low. Requesting airdrop...")
-            try:
-                await self.solana_client.request_airdrop(self.keypair.pubkey(), 2.0)
-                balance = await self.solana_client.get_balance(self.keypair.pubkey())
-                print(f"New balance: {balance} SOL")
-            except Exception as e:
-                print(f"Airdrop failed: {e}")
-                print("Continuing with current balance...")
+            self._airdrop_task = asyncio.create_task(self._airdrop(2.0))
         
         print("Agent A initialized successfully!")
     
+    async def _airdrop(self, amount_sol: float):
+        """Request an airdrop and report the resulting balance"""
+        try:
+            await self.solana_client.request_airdrop(self.keypair.pubkey(), amount_sol)
+            balance = await self.solana_client.get_balance(self.keypair.pubkey())
+            print(f"New balance: {balance} SOL")
+        except Exception as e:
+            print(f"Airdrop failed: {e}")
+            print("Continuing with current balance...")
+    
+    async def _wait_for_funds(self):
+        """Wait for a pending airdrop started during initialization"""
+        if self._airdrop_task is not None:
+            await self._airdrop_task
+            self._airdrop_task = None
+    
     def set_agent_b_address(self, pubkey: Pubkey):
         """Set Agent B's public key"""
         self.agent_b_pubkey = pubkey
@@ -78,14 +111,30 @@ class AgentA:
         print(f"Input Data: {input_data}")
         print(f"Payment Amount: {payment_amount} SOL")
         
+        # Make sure any pending airdrop has landed before paying
+        await self._wait_for_funds()
+        
         # Send payment with service request memo
-        signature, memo_content = await self.solana_client.send_transaction_with_memo(
+        send = self.solana_client.send_transaction_with_memo(
             sender=self.keypair,
             recipient=self.agent_b_pubkey,
             amount_sol=payment_amount,
             memo=memo
         )
         
+        # Compute the expected result off the event loop while the payment is in flight
+        verifier = self.result_verifiers.get(service_type)
+        if verifier:
+            (signature, memo_content), expected_result = await asyncio.gather(
+                send,
+                asyncio.to_thread(verifier, input_data)
+            )
+            self._expected_results[(service_type, input_data)] = expected_result
+        else:
+            signature, memo_content = await send
+        
+        self._request_memos[signature] = memo_content
+        
         # Log transaction
         self.transaction_log.append({
             'type': 'service_request',
@@ -95,18 +144,23 @@ class AgentA:
             'recipient': str(self.agent_b_pubkey)
         })
         
-        print(f"\n✓ Service request sent successfully!")
-        print(f"Transaction: https://explorer.solana.com/tx/{signature}?cluster=devnet")
+        print(f"\n✓ Service request sent successfully!\nTransaction: {explorer_url(signature)}")
         
         return signature
     
-    async def verify_service_result(self, response_signature: str, expected_input: str) -> bool:
+    async def verify_service_result(
+        self,
+        response_signature: str,
+        expected_input: str,
+        request_signature: Optional[str] = None
+    ) -> bool:
         """
         Verify the service result from Agent B
         
         Args:
             response_signature: Transaction signature of Agent B's response
             expected_input: Original input data to verify against
+            request_signature: Signature of the originating request, recorded for audit
         
         Returns:
             True if verification passed, False otherwise
@@ -115,16 +169,25 @@ class AgentA:
         
         print(f"Response Transaction: {response_signature}")
         
-        # Wait a bit for transaction to be fully processed
-        await asyncio.sleep(2)
+        # Wait until the response transaction is confirmed before reading its memo
+        await self.solana_client.wait_for_confirmation(response_signature)
         
-        # Retrieve memo from response transaction
-        memo = await self.solana_client.get_transaction_memo(response_signature)
+        # Retrieve memo from response transaction. The request memo is taken from
+        # our own record, or fetched alongside the response if we did not send it
+        request_memo = self._request_memos.get(request_signature) if request_signature else None
+        if request_signature and request_memo is None:
+            memo, request_memo = await self.solana_client.get_transaction_memos(
+                [response_signature, request_signature]
+            )
+        else:
+            memo = await self.solana_client.get_transaction_memo(response_signature)
         
         if not memo:
             print("✗ Could not retrieve memo from response transaction")
             return False
         
+        if request_memo:
+            print(f"Request Memo: {request_memo}")
         print(f"Response Memo: {memo}")
         
         # Parse response memo
@@ -142,19 +205,24 @@ class AgentA:
             print(f"Result: {result}")
             
             # Verify the result
-            if service_type == 'hash':
-                expected_hash = ServiceProvider.compute_sha256(expected_input)
-                print(f"Expected Hash: {expected_hash}")
-                
-                if result == expected_hash:
-                    print("\n✓ Verification PASSED! Result is correct.")
-                    return True
-                else:
-                    print("\n✗ Verification FAILED! Result does not match.")
-                    return False
-            else:
+            verifier = self.result_verifiers.get(service_type)
+            if verifier is None:
                 print(f"✗ Unknown service type: {service_type}")
                 return False
+            
+            # Reuse the result computed when the request was sent
+            expected_result = self._expected_results.get((service_type, expected_input))
+            if expected_result is None:
+                expected_result = verifier(expected_input)
+            print(f"Expected Result: {expected_result}")
+            
+            # Constant-time compare; encoded so non-ASCII memo text can't raise
+            if hmac.compare_digest(result.encode(), expected_result.encode()):
+                print("\n✓ Verification PASSED! Result is correct.")
+                return True
+            else:
+                print("\n✗ Verification FAILED! Result does not match.")
+                return False
         
         except Exception as e:
             print(f"✗ Error during verification: {e}")
@@ -176,10 +244,15 @@ class AgentA:
         print(f"Proof Status: {'VERIFIED' if verified else 'FAILED'}")
         print(f"Reference Transaction: {response_signature}")
         
-        # Publish proof as memo-only transaction
+        # Publish proof as memo-only transaction; the proof is a terminal artifact,
+        # so confirmation runs in the background instead of blocking the demo
         proof_signature = await self.solana_client.send_memo_only(
             sender=self.keypair,
-            memo=proof_memo
+            memo=proof_memo,
+            confirm=False
+        )
+        self._pending_confirmations.append(
+            asyncio.create_task(self._confirm_in_background(proof_signature))
         )
         
         # Log transaction
@@ -191,24 +264,36 @@ class AgentA:
             'reference_tx': response_signature
         })
         
-        print(f"\n✓ Verification proof published on-chain!")
-        print(f"Proof Transaction: https://explorer.solana.com/tx/{proof_signature}?cluster=devnet")
+        print(f"\n✓ Verification proof published on-chain!\nProof Transaction: {explorer_url(proof_signature)}")
         
         return proof_signature
     
-    def save_transaction_log(self, output_path: str = "logs/agent_a_transactions.json"):
-        """Save transaction log to file"""
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_file, 'w') as f:
-            json.dump(self.transaction_log, f, indent=2)
+    async def _confirm_in_background(self, signature: str):
+        """Confirm a submitted transaction and report the outcome"""
+        if await self.solana_client.wait_for_confirmation(signature):
+            print(f"\n✓ Transaction confirmed: {signature}")
+        else:
+            print(f"\n✗ Transaction not confirmed in time: {signature}")
+    
+    async def wait_for_pending_confirmations(self):
+        """Wait for background confirmations started by publish_verification_proof"""
+        pending, self._pending_confirmations = self._pending_confirmations, []
+        await asyncio.gather(*pending)
+    
+    async def save_transaction_log(self, output_path: str = "logs/agent_a_transactions.json"):
+        """Save transaction log to file (off the event loop)"""
+        await asyncio.to_thread(write_json, output_path, self.transaction_log)
         
         print(f"\nTransaction log saved to {output_path}")
     
     async def close(self):
         """Cleanup"""
-        await self.solana_client.close()
+        if self._airdrop_task is not None:
+            self._airdrop_task.cancel()
+        for task in self._pending_confirmations:
+            task.cancel()
+        if self._owns_client:
+            await self.solana_client.close()
 
 
 async def main():
@@ -221,6 +306,7 @@ async def main():
     try:
         # Initialize
         await agent_a.initialize()
+        await agent_a._wait_for_funds()
         
         # For standalone testing, you would need to set Agent B's address
         # In the full demo, this will be coordinated by the demo script
@@ -9,33 +9,44 @@ Responsibilities:
 """
 
 import asyncio
-import json
-from pathlib import Path
+from typing import Optional
 from solders.pubkey import Pubkey
-from utils import WalletManager, SolanaClient, ServiceProvider, print_section
+from utils import WalletManager, SolanaClient, ServiceProvider, print_section, explorer_url, write_json
 
 
 class AgentB:
     """Agent B - Service Provider"""
     
-    def __init__(self, wallet_path: str = "wallets/agent_b.json"):
+    def __init__(self, wallet_path: str = "wallets/agent_b.json", solana_client: Optional[SolanaClient] = None):
         self.wallet_manager = WalletManager(wallet_path)
         self.keypair = None
-        self.solana_client = SolanaClient()
+        # A shared client is owned (and closed) by whoever passed it in
+        self._owns_client = solana_client is None
+        self.solana_client = solana_client or SolanaClient()
         self.transaction_log = []
         self.services = {
             'hash': self._execute_hash_service
         }
     
-    async def initialize(self):
-        """Initialize Agent B"""
+    async def initialize(self, balance: Optional[float] = None):
+        """
+        Initialize Agent B
+        
+        Args:
+            balance: Current SOL balance if the caller already fetched it
+        """
         print_section("AGENT B INITIALIZATION")
         
         # Create or load wallet
-        self.keypair = self.wallet_manager.create_or_load()
+        if self.keypair is None:
+            self.keypair = self.wallet_manager.create_or_load()
+        
+        # Keep a recent blockhash warm for outgoing transactions
+        await self.solana_client.start_blockhash_updater()
         
         # Check balance
-        balance = await self.solana_client.get_balance(self.keypair.pubkey())
+        if balance is None:
+            balance = await self.solana_client.get_balance(self.keypair.pubkey())
         print(f"Current balance: {balance} SOL")
         
         # Request airdrop if balance is low (needed for transaction fees)
@@ -67,8 +78,8 @@ class AgentB:
         
         print(f"Request Transaction: {request_signature}")
         
-        # Wait a bit for transaction to be fully processed
-        await asyncio.sleep(2)
+        # Wait until the request transaction is confirmed before reading its memo
+        await self.solana_client.wait_for_confirmation(request_signature)
         
         # Retrieve memo from request transaction
         memo = await self.solana_client.get_transaction_memo(request_signature)
@@ -127,9 +138,8 @@ class AgentB:
         # 2. Verify the sender matches expected_sender
         # 3. Verify the recipient is our address
         # For this demo, we assume the transaction exists and is valid
+        # (its memo was already read, so no further RPC is needed here)
         
-        balance = await self.solana_client.get_balance(self.keypair.pubkey())
-        print(f"Current balance: {balance} SOL")
         print("✓ Payment verified (transaction exists on-chain)")
     
     async def execute_service(self, service_type: str, input_data: str) -> str:
@@ -197,24 +207,20 @@ class AgentB:
             memo=response_memo
         )
         
-        print(f"\n✓ Service result sent!")
-        print(f"Response Transaction: https://explorer.solana.com/tx/{signature}?cluster=devnet")
+        print(f"\n✓ Service result sent!\nResponse Transaction: {explorer_url(signature)}")
         
         return signature
     
-    def save_transaction_log(self, output_path: str = "logs/agent_b_transactions.json"):
-        """Save transaction log to file"""
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_file, 'w') as f:
-            json.dump(self.transaction_log, f, indent=2)
+    async def save_transaction_log(self, output_path: str = "logs/agent_b_transactions.json"):
+        """Save transaction log to file (off the event loop)"""
+        await asyncio.to_thread(write_json, output_path, self.transaction_log)
         
         print(f"\nTransaction log saved to {output_path}")
     
     async def close(self):
         """Cleanup"""
-        await self.solana_client.close()
+        if self._owns_client:
+            await self.solana_client.close()
 
 
 async def main():
@@ -31,8 +31,10 @@ class ClaudeCraftEmbodiment:
         elif tx_type == "final":
             self.emit_action("celebrating", "Service complete! Celebrating in the Colosseum Plaza")
 
-def demo_embodied_marketplace():
+def demo_embodied_marketplace(interactive=False):
+    """Run the embodiment demo; interactive=True paces the steps for a human audience"""
     world = ClaudeCraftEmbodiment()
+    pause = 1 if interactive else 0
     
     print("="*80)
     print("🏰 CLAUDECRAFT EMBODIMENT: PHYSICAL AGENT PRESENCE")
@@ -44,14 +46,14 @@ def demo_embodied_marketplace():
     print(f"[Pos]    X: {world.position['x']}, Y: {world.position['y']}, Z: {world.position['z']}")
     
     # 2. Embodied Interaction
-    time.sleep(1)
-    world.sync_with_marketplace("request", "SHA256 Hash Service")
-    
-    time.sleep(1)
-    world.sync_with_marketplace("execution", "hello_world_hash")
-    
-    time.sleep(1)
-    world.sync_with_marketplace("final", "Success")
+    for tx_type, details in (
+        ("request", "SHA256 Hash Service"),
+        ("execution", "hello_world_hash"),
+        ("final", "Success"),
+    ):
+        if pause:
+            time.sleep(pause)
+        world.sync_with_marketplace(tx_type, details)
 
     print("\n" + "="*80)
     print("✨ VISION: AGENTS WITH BODIES, COMMERCE WITH TRUST")
@@ -11,7 +11,6 @@ Flow:
 """
 
 import asyncio
-import json
 import sys
 from pathlib import Path
 
@@ -20,15 +19,18 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from agent_a import AgentA
 from agent_b import AgentB
-from utils import print_section
+from utils import SolanaClient, print_section, explorer_url, write_json
+from output_buffer import buffered_output
 
 
 class A2ADemo:
     """Orchestrates the A2A service purchase demo"""
     
     def __init__(self):
-        self.agent_a = AgentA("wallets/agent_a.json")
-        self.agent_b = AgentB("wallets/agent_b.json")
+        # One RPC client (and connection pool) shared by both agents
+        self.solana_client = SolanaClient()
+        self.agent_a = AgentA("wallets/agent_a.json", self.solana_client)
+        self.agent_b = AgentB("wallets/agent_b.json", self.solana_client)
         self.demo_results = {
             'success': False,
             'transactions': {},
@@ -58,8 +60,11 @@ class A2ADemo:
             # Step 5: Agent A publishes proof
             proof_signature = await self.agent_a_publish_proof(response_signature, verified)
             
-            # Step 6: Save results
-            await self.save_results()
+            # Step 6: Save results while the proof confirms on-chain
+            await asyncio.gather(
+                self.save_results(),
+                self.agent_a.wait_for_pending_confirmations()
+            )
             
             # Mark demo as successful
             self.demo_results['success'] = True
@@ -80,13 +85,20 @@ class A2ADemo:
         """Initialize both Agent A and Agent B"""
         print_section("STEP 1: INITIALIZE AGENTS")
         
-        # Initialize Agent A
-        print("\n[Agent A]")
-        await self.agent_a.initialize()
-        
-        # Initialize Agent B
-        print("\n[Agent B]")
-        await self.agent_b.initialize()
+        # Load both wallets and fetch their balances in one batched RPC request
+        self.agent_a.keypair = self.agent_a.wallet_manager.create_or_load()
+        self.agent_b.keypair = self.agent_b.wallet_manager.create_or_load()
+        balance_a, balance_b = await self.solana_client.get_balances([
+            self.agent_a.keypair.pubkey(),
+            self.agent_b.keypair.pubkey()
+        ])
+        
+        # Initialize both agents concurrently; their airdrops are independent,
+        # so startup costs max(A, B) instead of A + B
+        await asyncio.gather(
+            self.agent_a.initialize(balance=balance_a),
+            self.agent_b.initialize(balance=balance_b)
+        )
         
         # Connect Agent A to Agent B
         self.agent_a.set_agent_b_address(self.agent_b.keypair.pubkey())
@@ -141,11 +153,13 @@ class A2ADemo:
         print(f"\n[Agent A] Verifying service result...")
         
         # Get the original input from the request
-        original_input = self.demo_results['transactions']['request']['input']
+        request = self.demo_results['transactions']['request']
+        original_input = request['input']
         
         verified = await self.agent_a.verify_service_result(
             response_signature=response_signature,
-            expected_input=original_input
+            expected_input=original_input,
+            request_signature=request['signature']
         )
         
         self.demo_results['verification'] = {
@@ -176,45 +190,45 @@ class A2ADemo:
         """Save demo results and transaction logs"""
         print_section("STEP 6: SAVE RESULTS")
         
-        # Save agent transaction logs
-        self.agent_a.save_transaction_log("logs/agent_a_transactions.json")
-        self.agent_b.save_transaction_log("logs/agent_b_transactions.json")
-        
-        # Save demo results
+        # Save agent transaction logs and demo results concurrently, off the event loop
         results_path = Path("logs/demo_results.json")
-        with open(results_path, 'w') as f:
-            json.dump(self.demo_results, f, indent=2)
+        await asyncio.gather(
+            self.agent_a.save_transaction_log("logs/agent_a_transactions.json"),
+            self.agent_b.save_transaction_log("logs/agent_b_transactions.json"),
+            asyncio.to_thread(write_json, results_path, self.demo_results)
+        )
         
         print(f"Demo results saved to {results_path}")
     
     def print_summary(self):
-        """Print demo summary"""
-        print("\n" + "=" * 80)
-        print("  DEMO SUMMARY")
-        print("=" * 80)
-        
+        """Print demo summary as a single block"""
+        rule = "=" * 80
         txs = self.demo_results['transactions']
-        
-        print(f"\n✓ Demo Status: {'SUCCESS' if self.demo_results['success'] else 'FAILED'}")
-        print(f"\nTransaction Chain:")
-        print(f"  1. Service Request:  {txs['request']['signature']}")
-        print(f"     https://explorer.solana.com/tx/{txs['request']['signature']}?cluster=devnet")
-        print(f"\n  2. Service Response: {txs['response']['signature']}")
-        print(f"     https://explorer.solana.com/tx/{txs['response']['signature']}?cluster=devnet")
-        print(f"\n  3. Verification Proof: {txs['proof']['signature']}")
-        print(f"     https://explorer.solana.com/tx/{txs['proof']['signature']}?cluster=devnet")
-        
-        print(f"\nVerification Result: {'✓ VERIFIED' if self.demo_results['verification']['verified'] else '✗ FAILED'}")
-        
-        print("\n" + "=" * 80)
-        print("All transactions are permanently recorded on Solana devnet blockchain.")
-        print("This demonstrates cryptographic proof of agent-to-agent interaction.")
-        print("=" * 80 + "\n")
+        verified = self.demo_results['verification']['verified']
+        
+        with buffered_output():
+            print(f"\n{rule}")
+            print("  DEMO SUMMARY")
+            print(rule)
+            print(f"\n✓ Demo Status: {'SUCCESS' if self.demo_results['success'] else 'FAILED'}")
+            print("\nTransaction Chain:")
+            print(f"  1. Service Request:  {txs['request']['signature']}")
+            print(f"     {explorer_url(txs['request']['signature'])}")
+            print(f"\n  2. Service Response: {txs['response']['signature']}")
+            print(f"     {explorer_url(txs['response']['signature'])}")
+            print(f"\n  3. Verification Proof: {txs['proof']['signature']}")
+            print(f"     {explorer_url(txs['proof']['signature'])}")
+            print(f"\nVerification Result: {'✓ VERIFIED' if verified else '✗ FAILED'}")
+            print(f"\n{rule}")
+            print("All transactions are permanently recorded on Solana devnet blockchain.")
+            print("This demonstrates cryptographic proof of agent-to-agent interaction.")
+            print(rule + "\n")
     
     async def cleanup(self):
         """Cleanup resources"""
         await self.agent_a.close()
         await self.agent_b.close()
+        await self.solana_client.close()
 
 
 async def main():
@@ -1,8 +1,13 @@
+import hmac
 import json
+import os
 import time
-from solprism_integration import ReasoningProof, hash_reasoning_trace
+from solprism_integration import ReasoningProof, sha256_hex
 from sipher_integration import SipherPrivacy
 
+# Theatrical pause while "detecting" the payment; FAST_DEMO=1 skips it
+_DETECT_PAUSE = 0 if os.environ.get("FAST_DEMO") else 1
+
 def run_privacy_verifiable_demo():
     """
     Demonstrates the complete flow of an A2A service purchase that is 
@@ -43,11 +48,11 @@ def run_privacy_verifiable_demo():
     print("\n[PHASE 3] Service Execution with Verifiable Reasoning")
     # Agent B detects payment and executes
     print("Agent B detecting shielded payment...")
-    time.sleep(1)
+    if _DETECT_PAUSE:
+        time.sleep(_DETECT_PAUSE)
     
     # Agent B generates result and reasoning proof
-    import hashlib
-    result = hashlib.sha256(input_data.encode()).hexdigest()
+    result = sha256_hex(input_data.encode())
     
     # Generate SOLPRISM reasoning trace
     b_proof = ReasoningProof("Agent B", "service_execution")
@@ -57,8 +62,7 @@ def run_privacy_verifiable_demo():
     b_proof.add_execution_detail("algorithm", "SHA256")
     b_proof.add_execution_detail("output", result)
     
-    b_trace = b_proof.generate_trace()
-    b_proof_hash = hash_reasoning_trace(b_trace)
+    b_proof_hash = b_proof.hash_trace()
     
     print(f"Service Result: {result}")
     print(f"Reasoning Proof Hash: {b_proof_hash}")
@@ -67,7 +71,7 @@ def run_privacy_verifiable_demo():
     # PHASE 4: Client Verification
     print("\n[PHASE 4] Client Verification")
     # Agent A receives result and verifies
-    is_valid = hashlib.sha256(input_data.encode()).hexdigest() == result
+    is_valid = hmac.compare_digest(sha256_hex(input_data.encode()), result)
     
     # Agent A generates its own reasoning proof for verification
     a_proof = ReasoningProof("Agent A", "result_verification")
@@ -75,8 +79,7 @@ def run_privacy_verifiable_demo():
     a_proof.add_observation("Verified result matches local computation")
     a_proof.set_decision("Accept service result and close transaction", confidence=100)
     
-    a_trace = a_proof.generate_trace()
-    a_proof_hash = hash_reasoning_trace(a_trace)
+    a_proof_hash = a_proof.hash_trace()
     
     print(f"Verification Result: {'✅ SUCCESS' if is_valid else '❌ FAILED'}")
     print(f"Verification Proof Hash: {a_proof_hash}")
@@ -1,7 +1,17 @@
+import asyncio
 import json
 import random
 import time
 
+try:
+    import numpy as np
+except ImportError:  # only needed for batch screening
+    np = None
+
+# Per-protocol skew applied to the aggregated health ratio, shared by the
+# single-wallet and batch paths
+PROTOCOL_SKEW = {"mango": 1.05, "drift": 0.95, "marginfi": 1.0}
+
 class LiquidationRadarMock:
     """
     Mock client for Liquidation-Radar API.
@@ -11,11 +21,15 @@ class LiquidationRadarMock:
     def __init__(self, api_url="http://157.180.92.250:3003/api"):
         self.api_url = api_url
 
-    def get_wallet_health(self, wallet_address):
+    async def get_wallet_health(self, wallet_address):
         """
         Simulates GET /risk/:wallet
         Returns aggregated health ratio across Solana protocols.
+        Async so many wallets can be screened with asyncio.gather once a real
+        HTTP client is wired in.
         """
+        await asyncio.sleep(0) # stands in for the HTTP round-trip
+        
         # Mocking a realistic response from Liquidation-Radar
         health_ratio = round(random.uniform(1.1, 2.5), 2)
         status = "SAFE" if health_ratio > 1.2 else "DANGER"
@@ -25,13 +39,26 @@ class LiquidationRadarMock:
             "aggregatedHealthRatio": health_ratio,
             "status": status,
             "protocols": {
-                "mango": {"health": round(health_ratio * 1.05, 2)},
-                "drift": {"health": round(health_ratio * 0.95, 2)},
-                "marginfi": {"health": round(health_ratio, 2)}
+                protocol: {"health": round(health_ratio * skew, 2)}
+                for protocol, skew in PROTOCOL_SKEW.items()
             },
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ")
         }
 
+    def get_wallet_health_batch(self, wallets):
+        """
+        Simulates GET /risk/:wallet for many wallets at once
+        Returns an (N, 4) array of health ratios, row-aligned with `wallets`: the
+        aggregate, then one column per PROTOCOL_SKEW entry (mango, drift, marginfi).
+        """
+        if np is None:
+            raise ImportError("numpy is required for get_wallet_health_batch")
+        
+        health = np.empty((len(wallets), 4))
+        health[:, 0] = np.random.default_rng().uniform(1.1, 2.5, size=len(wallets)).round(2)
+        np.multiply(health[:, :1], tuple(PROTOCOL_SKEW.values()), out=health[:, 1:])
+        return health.round(2, out=health)
+
 def demo_risk_aware_marketplace():
     radar = LiquidationRadarMock()
     
@@ -45,7 +72,7 @@ def demo_risk_aware_marketplace():
     
     # 2. Risk Assessment via Liquidation-Radar
     print(f"\n[Step 2] Querying Liquidation-Radar for Agent B's credit health...")
-    risk_data = radar.get_wallet_health(target_agent)
+    risk_data = asyncio.run(radar.get_wallet_health(target_agent))
     
     print(f"  Health Ratio: {risk_data['aggregatedHealthRatio']}")
     print(f"  Risk Status:  {risk_data['status']}")
@@ -0,0 +1,22 @@
+"""
+Buffered console output for the demos
+
+Everything printed inside buffered_output() is collected and written to
+stdout in a single call when the block exits, so a step or phase reaches
+the terminal as one block instead of many small writes.
+"""
+
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+
+@contextmanager
+def buffered_output():
+    """Collect everything printed in the block and write it to stdout at once"""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
@@ -1,6 +1,37 @@
 import json
-import hashlib
+import secrets
 import time
+from array import array
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class OracleQuote:
+    """A single Pyxis price quote with staking and reputation metadata"""
+    price: float
+    confidence: float
+    oracles_polled: int
+    min_stake_verified: bool
+    timestamp: int
+    signature: str
+
+class OracleQuoteBatch:
+    """Quotes for several pairs stored column-wise, ready for aggregation"""
+    def __init__(self, prices, confidences, timestamps, signatures, oracles_polled=5, min_stake_verified=True):
+        self.prices = array('d', prices)
+        self.confidences = array('d', confidences)
+        self.timestamps = array('q', timestamps)
+        self.signatures = list(signatures)
+        self.oracles_polled = oracles_polled
+        self.min_stake_verified = min_stake_verified
+        
+    def __len__(self):
+        return len(self.prices)
+        
+    def __getitem__(self, i):
+        return OracleQuote(
+            self.prices[i], self.confidences[i], self.oracles_polled,
+            self.min_stake_verified, self.timestamps[i], self.signatures[i]
+        )
 
 class PyxisOracleHook:
     """Mock integration for Pyxis Protocol - Oracle Marketplace"""
@@ -10,19 +41,22 @@ class PyxisOracleHook:
         
     def query_price_oracle(self, base_asset, quote_asset):
         """Query Pyxis for real-time service price benchmarks"""
+        return self.query_price_oracle_batch([(base_asset, quote_asset)])[0]
+        
+    def query_price_oracle_batch(self, pairs):
+        """Query Pyxis for several (base, quote) price feeds in one round"""
         # Mocking a decentralized price feed from Pyxis oracles
-        print(f"🔮 [Pyxis] Querying Oracle Marketplace for {base_asset}/{quote_asset} price feed...")
+        feeds = ", ".join(f"{base}/{quote}" for base, quote in pairs)
+        print(f"🔮 [Pyxis] Querying Oracle Marketplace for {feeds} price feed{'s' if len(pairs) > 1 else ''}...")
         
         # Simulated oracle response with staking and reputation metadata
-        oracle_data = {
-            "price": 0.095 if base_asset == "SHA256_SERVICE" else 1.0,
-            "confidence": 0.98,
-            "oracles_polled": 5,
-            "min_stake_verified": True,
-            "timestamp": int(time.time()),
-            "signature": hashlib.sha256(str(time.time()).encode()).hexdigest()[:16]
-        }
-        return oracle_data
+        now = int(time.time())
+        return OracleQuoteBatch(
+            prices=[0.095 if base == "SHA256_SERVICE" else 1.0 for base, _ in pairs],
+            confidences=[0.98] * len(pairs),
+            timestamps=[now] * len(pairs),
+            signatures=[secrets.token_hex(8) for _ in pairs]
+        )
 
 class SmallvilleSocialHook:
     """Mock integration for Solana Smallville - Generative Agents Social Layer"""
@@ -18,12 +18,12 @@ class SipherPrivacy:
         Simulates POST /v1/stealth/generate
         Returns a meta-address (spending + viewing public keys)
         """
-        spending_priv = secrets.token_hex(32)
-        viewing_priv = secrets.token_hex(32)
+        spending_priv = secrets.token_bytes(32)
+        viewing_priv = secrets.token_bytes(32)
         
         # In a real scenario, these would be derived from the private keys
-        spending_pub = hashlib.sha256(spending_priv.encode()).hexdigest()
-        viewing_pub = hashlib.sha256(viewing_priv.encode()).hexdigest()
+        spending_pub = hashlib.sha256(spending_priv).hexdigest()
+        viewing_pub = hashlib.sha256(viewing_priv).hexdigest()
         
         return {
             "metaAddress": {
@@ -32,8 +32,8 @@ class SipherPrivacy:
                 "chain": "solana",
                 "label": label
             },
-            "spendingPrivateKey": spending_priv,
-            "viewingPrivateKey": viewing_priv
+            "spendingPrivateKey": spending_priv.hex(),
+            "viewingPrivateKey": viewing_priv.hex()
         }
 
     def derive_stealth_address(self, recipient_meta_address):
@@ -41,12 +41,16 @@ class SipherPrivacy:
         Simulates POST /v1/stealth/derive
         Derives a one-time stealth address from a meta-address
         """
-        ephemeral_priv = secrets.token_hex(32)
-        ephemeral_pub = hashlib.sha256(ephemeral_priv.encode()).hexdigest()
+        ephemeral_priv = secrets.token_bytes(32)
+        ephemeral_pub = hashlib.sha256(ephemeral_priv).hexdigest()
         
-        # Simplified DKSAP derivation
-        shared_secret = hashlib.sha256((ephemeral_priv + recipient_meta_address['spendingKey']).encode()).hexdigest()
-        stealth_address = hashlib.sha256((shared_secret + recipient_meta_address['viewingKey']).encode()).hexdigest()[:44] # Solana length
+        # Simplified DKSAP derivation over the raw key bytes
+        shared_secret = hashlib.sha256(
+            ephemeral_priv + bytes.fromhex(recipient_meta_address['spendingKey'])
+        ).digest()
+        stealth_address = hashlib.sha256(
+            shared_secret + bytes.fromhex(recipient_meta_address['viewingKey'])
+        ).digest()[:22].hex() # Solana length (44 chars)
         
         return {
             "stealthAddress": {
@@ -54,7 +58,7 @@ class SipherPrivacy:
                 "ephemeralPublicKey": ephemeral_pub,
                 "viewTag": secrets.randbelow(256)
             },
-            "shared_secret": shared_secret
+            "shared_secret": shared_secret.hex()
         }
 
     def build_shielded_transfer(self, sender, recipient_meta_address, amount):
@@ -66,8 +70,8 @@ class SipherPrivacy:
         
         # Simulate Pedersen commitment: C = v*G + r*H
         # Here we just store the commitment as a hash for the demo
-        blinding_factor = secrets.token_hex(32)
-        commitment = hashlib.sha256((str(amount) + blinding_factor).encode()).hexdigest()
+        blinding_factor = secrets.token_bytes(32)
+        commitment = hashlib.sha256(str(amount).encode() + blinding_factor).hexdigest()
         
         return {
             "success": True,
@@ -76,8 +80,8 @@ class SipherPrivacy:
                 "stealthAddress": stealth_data['stealthAddress']['address'],
                 "ephemeralPublicKey": stealth_data['stealthAddress']['ephemeralPublicKey'],
                 "commitment": commitment,
-                "blindingFactor": blinding_factor,
-                "viewingKeyHash": hashlib.sha256(recipient_meta_address['viewingKey'].encode()).hexdigest()
+                "blindingFactor": blinding_factor.hex(),
+                "viewingKeyHash": hashlib.blake2b(bytes.fromhex(recipient_meta_address['viewingKey']), digest_size=32).hexdigest()
             }
         }
 
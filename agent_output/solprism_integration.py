@@ -6,14 +6,146 @@ Based on community feedback from Mereum (@Mereum) in forum post #1239
 """
 
 import hashlib
-import json
-from typing import Dict, Any, List
-from datetime import datetime
+import hmac
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from blake3 import blake3
+except ImportError:  # BLAKE2b from hashlib is used instead
+    blake3 = None
+
+# Internal proof hashes (trace hash, Murkl proof hash) use BLAKE3 when the
+# binding is installed; set False to keep BLAKE2b. Service results stay SHA256.
+USE_BLAKE3_INTERNAL = True
+
+# Fixed trace text
+TRACE_VERSION = "1.0.0"
+TRACE_CONTEXT = "A2A service marketplace interaction"
+TRACE_LOGIC = "Autonomous agent decision-making logic"
+
+# Constant trace subtree, shared by every trace (treat as read-only)
+TRACE_INPUTS: Dict[str, str] = {"context": TRACE_CONTEXT}
+
+# Identifier of the canonical byte encoding below; it personalizes the trace
+# hash, so any change to the encoding must bump it
+TRACE_HASH_FORMAT = b"solprism-tlv-v3"
+
+# (epoch second, its "YYYY-MM-DDTHH:MM:SS" form), reformatted only when the second rolls over
+_iso_second: Tuple[Optional[int], str] = (None, "")
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix"""
+    global _iso_second
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _iso_second[0]:
+        _iso_second = (sec, "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(sec)[:6])
+    return "%s.%06dZ" % (_iso_second[1], ns // 1000)
+
+def internal_uses_blake3() -> bool:
+    """Whether internal digests currently use BLAKE3 (read at call time)"""
+    return USE_BLAKE3_INTERNAL and blake3 is not None
+
+def new_internal_hasher(use_blake3: Optional[bool] = None) -> Any:
+    """Hasher for internal trace digests (32-byte BLAKE3 or BLAKE2b, domain-separated)"""
+    if use_blake3 is None:
+        use_blake3 = internal_uses_blake3()
+    if use_blake3:
+        return blake3(derive_key_context=TRACE_HASH_FORMAT.decode())
+    return hashlib.blake2b(digest_size=32, person=TRACE_HASH_FORMAT)
+
+def _frame_str(text: str) -> bytes:
+    data = text.encode()
+    return b"s%d:" % len(data) + data
+
+# Pre-encoded canonical frames for the trace keys and fixed values, so the
+# hasher skips the encode and length prefix for them
+_STR_FRAMES: Dict[str, bytes] = {
+    text: _frame_str(text)
+    for text in (
+        "version", "agent", "timestamp", "action", "type", "description",
+        "inputs", "context", "analysis", "observations", "logic", "decision",
+        "actionChosen", "confidence", "riskAssessment", "execution",
+        TRACE_VERSION, TRACE_CONTEXT, TRACE_LOGIC
+    )
+}
+
+@lru_cache(maxsize=1024)
+def sha256_hex(data: bytes) -> str:
+    """SHA256 hex digest, memoized so provider and verifier hash a payload once"""
+    return hashlib.sha256(data).hexdigest()
+
+def _canonical_update(h: Any, obj: Any) -> None:
+    """
+    Feed obj into hasher h as a canonical, self-delimiting byte stream
+    
+    Every value is prefixed with a type tag, and strings and containers with
+    their length, so distinct traces can never produce the same stream. Dict
+    entries are visited in key order, so caller-filled sections (decision,
+    execution) hash the same however they were built; only the top-level trace
+    keys keep the order generate_trace() fixes (see _hash_raw). Format
+    (TRACE_HASH_FORMAT):
+        str   s<utf8 len>:<utf8>      dict  d<n>:<key><value>...
+        list  l<n>:<item>...          int   i<decimal>;
+        float r<repr>;                bool  t / f        None  n
+    """
+    if isinstance(obj, str):
+        frame = _STR_FRAMES.get(obj)
+        h.update(frame if frame is not None else _frame_str(obj))
+    elif isinstance(obj, dict):
+        h.update(b"d%d:" % len(obj))
+        for key, value in sorted(obj.items()):
+            _canonical_update(h, key)
+            _canonical_update(h, value)
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"l%d:" % len(obj))
+        for item in obj:
+            _canonical_update(h, item)
+    elif obj is None:
+        h.update(b"n")
+    elif isinstance(obj, bool):
+        h.update(b"t" if obj else b"f")
+    elif isinstance(obj, int):
+        h.update(b"i%d;" % obj)
+    elif isinstance(obj, float):
+        h.update(b"r%s;" % repr(obj).encode())
+    else:
+        raise TypeError(f"Unsupported type in reasoning trace: {type(obj).__name__}")
+
+def _agent_prefix_ctx(agent_name: str) -> Any:
+    """
+    Hasher primed with the stream prefix shared by every trace of one agent
+    (header, version and agent); callers resume from a copy()
+    """
+    return _primed_agent_prefix(agent_name, internal_uses_blake3())
+
+@lru_cache(maxsize=256)
+def _primed_agent_prefix(agent_name: str, use_blake3: bool) -> Any:
+    """_agent_prefix_ctx for one hash selection, cached per (agent, algorithm)"""
+    h = new_internal_hasher(use_blake3)
+    h.update(b"d8:") # generate_trace() always has 8 top-level keys
+    for text in ("version", TRACE_VERSION, "agent", agent_name):
+        _canonical_update(h, text)
+    return h
+
+def _hash_raw(trace: Dict[str, Any]) -> bytes:
+    """Raw 32-byte trace digest; hex is only produced at the output boundary"""
+    h = new_internal_hasher()
+    h.update(b"d%d:" % len(trace))
+    for key, value in trace.items():  # top-level keys in generate_trace() order
+        _canonical_update(h, key)
+        _canonical_update(h, value)
+    return h.digest()
 
 def hash_reasoning_trace(trace: Dict[str, Any]) -> str:
-    """Generate SHA256 hash of reasoning trace"""
-    trace_json = json.dumps(trace, sort_keys=True)
-    return hashlib.sha256(trace_json.encode()).hexdigest()
+    """
+    Generate the 32-byte internal hash of a reasoning trace, as hex
+    
+    The digest is internal to the demo (nothing external verifies it), so it
+    uses BLAKE3/BLAKE2b (see new_internal_hasher) rather than SHA256.
+    """
+    return _hash_raw(trace).hex()
 
 class ReasoningProof:
     """
@@ -21,69 +153,114 @@ class ReasoningProof:
     Compatible with SOLPRISM protocol structure
     """
     
-    def __init__(self, agent_name: str, action_type: str = "general"):
+    __slots__ = (
+        "agent_name", "action_type", "version", "observations", "decision",
+        "execution_details", "timestamp", "_template", "_prefix_ctx"
+    )
+    
+    agent_name: str
+    action_type: str
+    version: str
+    observations: List[str]
+    decision: Dict[str, Any]
+    execution_details: Dict[str, Any]
+    timestamp: str
+    _template: Dict[str, Any]
+    _prefix_ctx: Any
+    
+    def __init__(self, agent_name: str, action_type: str = "general") -> None:
         self.agent_name = agent_name
         self.action_type = action_type
-        self.version = "1.0.0"
+        self.version = TRACE_VERSION
         self.observations = []
         self.decision = {}
         self.execution_details = {}
-        self.timestamp = datetime.utcnow().isoformat() + "Z"
+        self.timestamp = utc_timestamp()
+        # Trace fields that are fixed once the proof is created
+        self._template = {
+            "version": self.version,
+            "agent": agent_name,
+            "timestamp": self.timestamp,
+            "action": {
+                "type": action_type,
+                "description": f"Agent {agent_name} performing {action_type}"
+            },
+            "inputs": TRACE_INPUTS
+        }
+        # Hasher primed with all static fields, extending the agent's shared
+        # prefix; hash_trace resumes from a copy
+        self._prefix_ctx = _agent_prefix_ctx(agent_name).copy()
+        for key in ("timestamp", "action", "inputs"):
+            _canonical_update(self._prefix_ctx, key)
+            _canonical_update(self._prefix_ctx, self._template[key])
         
-    def add_observation(self, observation: str):
+    def add_observation(self, observation: str) -> None:
         self.observations.append(observation)
         
-    def set_decision(self, action_chosen: str, confidence: int = 100, risk: str = "low"):
+    def set_decision(self, action_chosen: str, confidence: int = 100, risk: str = "low") -> None:
         self.decision = {
             "actionChosen": action_chosen,
             "confidence": confidence,
             "riskAssessment": risk
         }
         
-    def add_execution_detail(self, key: str, value: Any):
+    def add_execution_detail(self, key: str, value: Any) -> None:
         self.execution_details[key] = value
         
     def generate_trace(self) -> Dict[str, Any]:
         return {
-            "version": self.version,
-            "agent": self.agent_name,
-            "timestamp": self.timestamp,
-            "action": {
-                "type": self.action_type,
-                "description": f"Agent {self.agent_name} performing {self.action_type}"
-            },
-            "inputs": {
-                "context": "A2A service marketplace interaction"
-            },
+            **self._template,
             "analysis": {
                 "observations": self.observations,
-                "logic": "Autonomous agent decision-making logic"
+                "logic": TRACE_LOGIC
             },
             "decision": self.decision,
             "execution": self.execution_details
         }
+        
+    def hash_trace(self) -> str:
+        """Hex hash of the current trace, equal to hash_reasoning_trace(self.generate_trace())"""
+        return self._hash_raw().hex()
+        
+    def _hash_raw(self) -> bytes:
+        """
+        Raw digest of the current trace, equal to _hash_raw(self.generate_trace())
+        Only the variable sections are encoded; the static prefix is resumed.
+        """
+        h = self._prefix_ctx.copy()
+        _canonical_update(h, "analysis")
+        _canonical_update(h, {"observations": self.observations, "logic": TRACE_LOGIC})
+        _canonical_update(h, "decision")
+        _canonical_update(h, self.decision)
+        _canonical_update(h, "execution")
+        _canonical_update(h, self.execution_details)
+        return h.digest()
 
 # Helper functions for original demo compatibility
-def agent_b_with_reasoning_proof(input_data: str, service_type: str = "SHA256") -> tuple:
+def agent_b_with_reasoning_proof(
+    input_data: str, service_type: str = "SHA256"
+) -> Tuple[str, Dict[str, Any], str]:
     prover = ReasoningProof("Agent B", "service_execution")
-    result = hashlib.sha256(input_data.encode()).hexdigest()
+    result = sha256_hex(input_data.encode())
     
     prover.add_observation(f"Received request for {service_type}")
     prover.set_decision(f"Execute {service_type} and return result")
     prover.add_execution_detail("algorithm", service_type)
     prover.add_execution_detail("output", result)
     
-    trace = prover.generate_trace()
-    return result, trace, hash_reasoning_trace(trace)
+    return result, prover.generate_trace(), prover.hash_trace()
 
-def agent_a_verify_with_reasoning(input_data: str, received_result: str, service_tx: str) -> tuple:
+def agent_a_verify_with_reasoning(
+    input_data: str, received_result: str, service_tx: str, expected_result: Optional[str] = None
+) -> Tuple[bool, Dict[str, Any], str]:
+    # A verifier that already derived the expected digest (e.g. at request
+    # time) passes it in instead of hashing the input again
     prover = ReasoningProof("Agent A", "result_verification")
-    expected = hashlib.sha256(input_data.encode()).hexdigest()
-    verified = (expected == received_result)
+    expected = expected_result if expected_result is not None else sha256_hex(input_data.encode())
+    verified = hmac.compare_digest(expected.encode(), received_result.encode())
     
     prover.add_observation(f"Verifying result for tx {service_tx[:8]}...")
     prover.set_decision("Accept result" if verified else "Reject result")
     prover.add_execution_detail("verified", verified)
     
-    trace = prover.generate_trace()
-    return verified, trace, hash_reasoning_trace(trace)
+    return verified, prover.generate_trace(), prover.hash_trace()
@@ -4,18 +4,33 @@ Shared utilities for Agent A and Agent B
 Handles wallet management, transaction helpers, and memo operations
 """
 
-import json
+import asyncio
 import hashlib
+import json
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import httpx
+from solders.hash import Hash
+from solders.instruction import Instruction, AccountMeta
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
 from solana.rpc.async_api import AsyncClient
-from solana.rpc.commitment import Confirmed
+from solana.rpc.commitment import Commitment, Processed, Confirmed, Finalized
+from solana.rpc.types import TxOpts
+from solana.rpc.websocket_api import connect
 from solders.system_program import transfer, TransferParams
 from solders.transaction import VersionedTransaction
 from solders.message import MessageV0
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
 
 class WalletManager:
     """Manages wallet creation, loading, and saving"""
@@ -28,9 +43,7 @@ class WalletManager:
         """Create new wallet or load existing one"""
         if self.wallet_path.exists():
             print(f"Loading existing wallet from {self.wallet_path}")
-            with open(self.wallet_path, 'r') as f:
-                data = json.load(f)
-                self.keypair = Keypair.from_bytes(bytes(data['secret_key']))
+            self.keypair = load_keypair(str(self.wallet_path))
         else:
             print(f"Creating new wallet at {self.wallet_path}")
             self.keypair = Keypair()
@@ -41,12 +54,10 @@ class WalletManager:
     
     def _save(self):
         """Save wallet to file"""
-        self.wallet_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.wallet_path, 'w') as f:
-            json.dump({
-                'public_key': str(self.keypair.pubkey()),
-                'secret_key': list(bytes(self.keypair))
-            }, f, indent=2)
+        write_json(self.wallet_path, {
+            'public_key': str(self.keypair.pubkey()),
+            'secret_key': list(bytes(self.keypair))
+        })
         print(f"Wallet saved to {self.wallet_path}")
 
 
@@ -56,9 +67,107 @@ class SolanaClient:
     # Memo Program ID (official Solana Memo Program)
     MEMO_PROGRAM_ID = Pubkey.from_string("MemoSq4gqABAXKb96qnH8TysNcWxMyWCqXgDLGmfcHr")
     
-    def __init__(self, rpc_url: str = "https://api.devnet.solana.com"):
+    # Upper bound on calls per JSON-RPC batch request
+    MAX_BATCH_SIZE = 10
+    
+    # Upper bound on cached memo instructions
+    MEMO_IX_CACHE_SIZE = 256
+    
+    # Seconds a cached blockhash is reused for (blockhashes expire after ~60s)
+    BLOCKHASH_MAX_AGE = 30.0
+    
+    # Our transactions are built locally and known-good, so skip the preflight
+    # simulation and let the RPC node rebroadcast a few times instead
+    SEND_OPTS = TxOpts(skip_preflight=True, preflight_commitment=Processed, max_retries=3)
+    
+    # Signature statuses that satisfy each commitment level
+    CONFIRMATION_LEVELS = {
+        Processed: (
+            TransactionConfirmationStatus.Processed,
+            TransactionConfirmationStatus.Confirmed,
+            TransactionConfirmationStatus.Finalized
+        ),
+        Confirmed: (
+            TransactionConfirmationStatus.Confirmed,
+            TransactionConfirmationStatus.Finalized
+        ),
+        Finalized: (TransactionConfirmationStatus.Finalized,)
+    }
+    
+    def __init__(
+        self,
+        rpc_url: str = "https://api.devnet.solana.com",
+        ws_url: Optional[str] = None,
+        extra_headers: Optional[Dict[str, str]] = None
+    ):
         self.rpc_url = rpc_url
-        self.client = AsyncClient(rpc_url)
+        self.ws_url = ws_url or rpc_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        self.client = AsyncClient(rpc_url, extra_headers=extra_headers)
+        # Separate HTTP pool for raw JSON-RPC batches: AsyncClient keeps its session
+        # on a private provider and only batches typed solders requests, so it cannot
+        # be shared. Opened on the first batch (see _post_batch), closed only in close()
+        self._extra_headers = extra_headers
+        self._batch_session: Optional[httpx.AsyncClient] = None
+        self._cached_bh: Optional[Hash] = None
+        self._cached_bh_at = 0.0
+        self._blockhash_task: Optional[asyncio.Task] = None
+        # Memo instructions and signer metas are immutable, so they are reused
+        self._memo_ix_cache: Dict[Tuple[Pubkey, bytes], Instruction] = {}
+        self._signer_metas: Dict[Pubkey, AccountMeta] = {}
+    
+    async def start_blockhash_updater(self, interval: float = 2.0):
+        """
+        Keep a recent blockhash cached in the background
+        Senders read the cached value instead of paying an RPC round-trip per transaction
+        """
+        if self._blockhash_task is not None:
+            return
+        
+        # Claim the updater before the first await, so concurrent callers
+        # sharing this client (e.g. both agents initializing) start one loop
+        self._blockhash_task = asyncio.create_task(self._refresh_loop(interval))
+        # Prime the cache so the first send does not race the refresh loop
+        try:
+            await self._refresh_blockhash()
+        except BaseException:
+            await self.stop_blockhash_updater()
+            raise
+    
+    async def _refresh_loop(self, interval: float):
+        """Refresh the cached blockhash every `interval` seconds"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._refresh_blockhash()
+            except Exception as e:
+                print(f"Blockhash refresh failed: {e}")
+    
+    async def _refresh_blockhash(self) -> Hash:
+        """Fetch the latest blockhash and cache it with its fetch time"""
+        self._cached_bh = (await self.client.get_latest_blockhash()).value.blockhash
+        self._cached_bh_at = time.monotonic()
+        return self._cached_bh
+    
+    async def get_cached_blockhash(self) -> Hash:
+        """
+        Return the cached blockhash while it is fresh (under BLOCKHASH_MAX_AGE seconds old)
+        Otherwise fetch a new one, e.g. before the updater starts or after refreshes fail
+        """
+        if self._cached_bh is not None and time.monotonic() - self._cached_bh_at < self.BLOCKHASH_MAX_AGE:
+            return self._cached_bh
+        return await self._refresh_blockhash()
+    
+    async def stop_blockhash_updater(self):
+        """Cancel the background blockhash refresh"""
+        if self._blockhash_task is None:
+            return
+        self._blockhash_task.cancel()
+        try:
+            await self._blockhash_task
+        except asyncio.CancelledError:
+            pass
+        self._blockhash_task = None
+        self._cached_bh = None
     
     async def get_balance(self, pubkey: Pubkey) -> float:
         """Get SOL balance in SOL (not lamports)"""
@@ -66,10 +175,52 @@ class SolanaClient:
         lamports = response.value
         return lamports / 1_000_000_000
     
+    async def get_balances(self, pubkeys: List[Pubkey]) -> List[float]:
+        """Get SOL balances for several accounts in a single batched RPC request"""
+        results = await self.batch_rpc([
+            ("getBalance", [str(pubkey), {"commitment": Confirmed}])
+            for pubkey in pubkeys
+        ])
+        return [result["value"] / 1_000_000_000 for result in results]
+    
+    async def batch_rpc(self, calls: List[Tuple[str, list]]) -> list:
+        """
+        Send JSON-RPC calls as batch requests (one HTTP POST per MAX_BATCH_SIZE calls)
+        Returns the results in call order
+        """
+        batches = [
+            calls[offset:offset + self.MAX_BATCH_SIZE]
+            for offset in range(0, len(calls), self.MAX_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(*(self._post_batch(batch) for batch in batches))
+        return [result for response in responses for result in response]
+    
+    async def _post_batch(self, calls: List[Tuple[str, list]]) -> list:
+        """POST a single JSON-RPC batch and match responses back to calls by id"""
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        
+        if self._batch_session is None:
+            # Same headers as the RPC client (e.g. RPC auth)
+            self._batch_session = httpx.AsyncClient(headers=self._extra_headers, timeout=10)
+        response = await self._batch_session.post(self.rpc_url, json=payload)
+        response.raise_for_status()
+        
+        # Batch responses may come back in any order
+        by_id = {item["id"]: item for item in response.json()}
+        results = []
+        for request_id, (method, _) in enumerate(calls):
+            item = by_id.get(request_id)
+            if item is None or "error" in item:
+                error = item["error"] if item else "missing response"
+                raise Exception(f"Batch RPC call {method} failed: {error}")
+            results.append(item["result"])
+        return results
+    
     async def request_airdrop(self, pubkey: Pubkey, amount_sol: float = 2.0, max_retries: int = 5) -> str:
         """Request devnet SOL airdrop with retry logic"""
-        import asyncio
-        
         for attempt in range(max_retries):
             try:
                 print(f"Requesting {amount_sol} SOL airdrop (attempt {attempt + 1}/{max_retries})...")
@@ -105,9 +256,10 @@ class SolanaClient:
         """
         print(f"\nSending {amount_sol} SOL to {recipient}")
         print(f"Memo: {memo}")
+        memo_bytes = memo.encode('utf-8')
         
-        # Get latest blockhash
-        latest_blockhash = await self.client.get_latest_blockhash()
+        # Get recent blockhash (served from cache when the updater is running)
+        recent_blockhash = await self.get_cached_blockhash()
         
         # Create transfer instruction
         lamports = int(amount_sol * 1_000_000_000)
@@ -120,21 +272,21 @@ class SolanaClient:
         )
         
         # Create memo instruction
-        memo_ix = self._create_memo_instruction(sender.pubkey(), memo)
+        memo_ix = self._create_memo_instruction(sender.pubkey(), memo_bytes)
         
         # Create message with both instructions
         message = MessageV0.try_compile(
             payer=sender.pubkey(),
             instructions=[transfer_ix, memo_ix],
             address_lookup_table_accounts=[],
-            recent_blockhash=latest_blockhash.value.blockhash
+            recent_blockhash=recent_blockhash
         )
         
         # Create and sign transaction
         transaction = VersionedTransaction(message, [sender])
         
         # Send transaction
-        response = await self.client.send_transaction(transaction)
+        response = await self.client.send_transaction(transaction, opts=self.SEND_OPTS)
         signature = str(response.value)
         
         print(f"Transaction sent. Signature: {signature}")
@@ -145,53 +297,189 @@ class SolanaClient:
         
         return signature, memo
     
-    async def send_memo_only(self, sender: Keypair, memo: str) -> str:
+    async def send_memo_only(self, sender: Keypair, memo: str, confirm: bool = True) -> str:
         """
         Send a memo-only transaction (no transfer)
         Useful for publishing proofs
+        With confirm=False the signature is returned as soon as the transaction is submitted
         """
         print(f"\nPublishing memo: {memo}")
+        memo_bytes = memo.encode('utf-8')
         
-        # Get latest blockhash
-        latest_blockhash = await self.client.get_latest_blockhash()
+        # Get recent blockhash (served from cache when the updater is running)
+        recent_blockhash = await self.get_cached_blockhash()
         
         # Create memo instruction
-        memo_ix = self._create_memo_instruction(sender.pubkey(), memo)
+        memo_ix = self._create_memo_instruction(sender.pubkey(), memo_bytes)
         
         # Create message with memo instruction only
         message = MessageV0.try_compile(
             payer=sender.pubkey(),
             instructions=[memo_ix],
             address_lookup_table_accounts=[],
-            recent_blockhash=latest_blockhash.value.blockhash
+            recent_blockhash=recent_blockhash
         )
         
         # Create and sign transaction
         transaction = VersionedTransaction(message, [sender])
         
         # Send transaction
-        response = await self.client.send_transaction(transaction)
+        response = await self.client.send_transaction(transaction, opts=self.SEND_OPTS)
         signature = str(response.value)
         
         print(f"Memo published. Signature: {signature}")
         
         # Wait for confirmation
-        await self.client.confirm_transaction(response.value, commitment=Confirmed)
-        print("Memo transaction confirmed!")
+        if confirm:
+            await self.client.confirm_transaction(response.value, commitment=Confirmed)
+            print("Memo transaction confirmed!")
         
         return signature
     
-    def _create_memo_instruction(self, signer: Pubkey, memo: str):
-        """Create a memo instruction"""
-        from solders.instruction import Instruction, AccountMeta
+    async def send_memos_batch(self, sender: Keypair, memos: List[str], confirm: bool = True) -> List[str]:
+        """
+        Send several memo-only transactions concurrently
+        All transactions share one blockhash; sends and confirmations are each gathered,
+        so N memos cost roughly one round-trip instead of N.
+        Returns the signatures in the order of `memos`
+        """
+        print(f"\nPublishing {len(memos)} memos")
+        recent_blockhash = await self.get_cached_blockhash()
         
-        memo_bytes = memo.encode('utf-8')
+        transactions = [
+            VersionedTransaction(
+                MessageV0.try_compile(
+                    payer=sender.pubkey(),
+                    instructions=[self._create_memo_instruction(sender.pubkey(), memo.encode('utf-8'))],
+                    address_lookup_table_accounts=[],
+                    recent_blockhash=recent_blockhash
+                ),
+                [sender]
+            )
+            for memo in memos
+        ]
         
-        return Instruction(
+        responses = await asyncio.gather(
+            *(self.client.send_transaction(tx, opts=self.SEND_OPTS) for tx in transactions)
+        )
+        signatures = [str(response.value) for response in responses]
+        print(f"Memos published. Signatures: {', '.join(signatures)}")
+        
+        if confirm:
+            confirmed = await asyncio.gather(
+                *(self.wait_for_confirmation(response.value) for response in responses)
+            )
+            unconfirmed = [sig for sig, ok in zip(signatures, confirmed) if not ok]
+            if unconfirmed:
+                raise Exception(f"Memo transactions not confirmed: {', '.join(unconfirmed)}")
+            print("Memo transactions confirmed!")
+        
+        return signatures
+    
+    async def wait_for_confirmation(
+        self,
+        signature,
+        commitment: Commitment = Confirmed,
+        timeout: float = 30.0
+    ) -> bool:
+        """
+        Wait until the transaction reaches `commitment`
+        Uses a signatureSubscribe websocket so we are notified as soon as the slot lands,
+        falling back to status polling if the websocket is unavailable
+        Returns True once confirmed, False on timeout
+        """
+        sig = Signature.from_string(signature) if isinstance(signature, str) else signature
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        try:
+            confirmed = await asyncio.wait_for(self._subscribe_confirmation(sig, commitment), timeout)
+        except asyncio.TimeoutError:
+            print(f"Timed out waiting for confirmation of {sig}")
+            return False
+        if confirmed is None:
+            # Polling only gets what is left of the caller's timeout
+            return await self._poll_confirmation(sig, commitment, timeout=deadline - loop.time())
+        return confirmed
+    
+    async def _subscribe_confirmation(self, sig: Signature, commitment: Commitment) -> Optional[bool]:
+        """
+        Block on a signatureNotification for `sig`
+        Returns None if the websocket fails (including connect timeouts), so the
+        caller can fall back to polling; only the caller's wait_for times out
+        """
+        try:
+            async with connect(self.ws_url) as websocket:
+                await websocket.signature_subscribe(sig, commitment=commitment)
+                await websocket.recv()  # subscription id
+                
+                # The transaction may have landed before the subscription was active,
+                # in which case no notification will ever arrive
+                if await self._is_confirmed(sig, commitment):
+                    return True
+                
+                await websocket.recv()  # signatureNotification
+                return True
+        except Exception as e:
+            print(f"Signature subscription failed ({e}), falling back to polling")
+            return None
+    
+    async def _is_confirmed(self, sig: Signature, commitment: Commitment) -> bool:
+        """Single getSignatureStatuses check against `commitment`"""
+        response = await self.client.get_signature_statuses([sig])
+        status = response.value[0]
+        return bool(status) and status.confirmation_status in self.CONFIRMATION_LEVELS[commitment]
+    
+    async def _poll_confirmation(
+        self,
+        sig: Signature,
+        commitment: Commitment,
+        interval: float = 0.4,
+        timeout: float = 30.0,
+        max_interval: float = 3.5
+    ) -> bool:
+        """
+        Poll getSignatureStatuses until the transaction reaches `commitment`
+        Starts at roughly one slot time and backs off exponentially up to max_interval
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = interval
+        
+        while True:
+            if await self._is_confirmed(sig, commitment):
+                return True
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                print(f"Timed out waiting for confirmation of {sig}")
+                return False
+            
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_interval)
+    
+    def _create_memo_instruction(self, signer: Pubkey, memo_bytes: bytes) -> Instruction:
+        """Create a memo instruction (cached per signer and memo)"""
+        key = (signer, memo_bytes)
+        memo_ix = self._memo_ix_cache.get(key)
+        if memo_ix is not None:
+            return memo_ix
+        
+        signer_meta = self._signer_metas.get(signer)
+        if signer_meta is None:
+            signer_meta = AccountMeta(pubkey=signer, is_signer=True, is_writable=False)
+            self._signer_metas[signer] = signer_meta
+        
+        memo_ix = Instruction(
             program_id=self.MEMO_PROGRAM_ID,
             data=memo_bytes,
-            accounts=[AccountMeta(pubkey=signer, is_signer=True, is_writable=False)]
+            accounts=[signer_meta]
         )
+        if len(self._memo_ix_cache) >= self.MEMO_IX_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._memo_ix_cache[next(iter(self._memo_ix_cache))]
+        self._memo_ix_cache[key] = memo_ix
+        return memo_ix
     
     async def get_transaction_memo(self, signature: str) -> Optional[str]:
         """
@@ -243,18 +531,35 @@ class SolanaClient:
             print(f"Error retrieving transaction memo: {e}")
             return None
     
+    async def get_transaction_memos(self, signatures: List[str]) -> List[Optional[str]]:
+        """Retrieve memos from several transactions concurrently"""
+        return list(await asyncio.gather(
+            *(self.get_transaction_memo(signature) for signature in signatures)
+        ))
+    
     async def close(self):
-        """Close the RPC client"""
+        """Close the RPC client and the batch session"""
+        await self.stop_blockhash_updater()
+        if self._batch_session is not None:
+            await self._batch_session.aclose()
+            self._batch_session = None
         await self.client.close()
 
 
 class ServiceProvider:
     """Service execution utilities"""
     
+    # Memo templates, bound once at class scope
+    _RESPONSE_MEMO = "RESPONSE:{}:{}".format
+    _PROOF_MEMO = "PROOF:{}:{}".format
+    
     @staticmethod
-    def compute_sha256(text: str) -> str:
-        """Compute SHA256 hash of text"""
-        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    @lru_cache(maxsize=4096)
+    def compute_sha256(text) -> str:
+        """Compute SHA256 hash of text (str or bytes), memoized per input"""
+        # str.encode() with no arguments takes the UTF-8 fast path without a codec-name
+        # lookup; short service inputs (< 56 bytes) are then a single SHA256 block
+        return hashlib.sha256(text.encode() if isinstance(text, str) else text).hexdigest()
     
     @staticmethod
     def parse_service_request(memo: str) -> Optional[dict]:
@@ -264,12 +569,13 @@ class ServiceProvider:
         Example: REQUEST:hash:hello_world
         """
         try:
-            parts = memo.split(':', 2)
-            if len(parts) == 3 and parts[0] == 'REQUEST':
-                return {
-                    'type': parts[1],
-                    'input': parts[2]
-                }
+            if memo.startswith('REQUEST:'):
+                service_type, sep, input_data = memo[8:].partition(':')
+                if sep:
+                    return {
+                        'type': service_type,
+                        'input': input_data
+                    }
         except Exception as e:
             print(f"Error parsing service request: {e}")
         return None
@@ -280,7 +586,7 @@ class ServiceProvider:
         Create service response memo
         Format: RESPONSE:service_type:result
         """
-        return f"RESPONSE:{service_type}:{result}"
+        return ServiceProvider._RESPONSE_MEMO(service_type, result)
     
     @staticmethod
     def create_verification_proof(tx_signature: str, verified: bool) -> str:
@@ -288,12 +594,40 @@ class ServiceProvider:
         Create verification proof memo
         Format: PROOF:status:tx_signature
         """
-        status = "verified" if verified else "failed"
-        return f"PROOF:{status}:{tx_signature}"
+        return ServiceProvider._PROOF_MEMO("verified" if verified else "failed", tx_signature)
+
+
+def read_json(path):
+    """Read a JSON file"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_keypair(path: str) -> Keypair:
+    """Load a keypair from a wallet file (parsed once per path per process)"""
+    return Keypair.from_bytes(bytes(read_json(path)['secret_key']))
+
+
+def write_json(path, data):
+    """Write data to a JSON file, creating parent directories as needed"""
+    output_file = Path(path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_file, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def explorer_url(signature) -> str:
+    """Solana Explorer link for a devnet transaction"""
+    return f"https://explorer.solana.com/tx/{signature}?cluster=devnet"
 
 
 def print_section(title: str):
     """Print a formatted section header"""
-    print("\n" + "=" * 80)
-    print(f"  {title}")
-    print("=" * 80)
+    rule = "=" * 80
+    print(f"\n{rule}\n  {title}\n{rule}")
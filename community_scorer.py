@@ -4,118 +4,379 @@ Community Engagement Scorer
 Analyzes projects and forum posts, scores them based on criteria, and selects candidates for voting/commenting
 """
 
+import hashlib
+import heapq
 import json
+import os
 import re
+import shelve
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from itertools import accumulate, chain
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib codec
+    orjson = None
+
+# Keywords per category (project scoring and forum triage)
+KEYWORDS = {
+    "technical": frozenset(['api', 'blockchain', 'smart contract', 'algorithm', 'architecture',
+                            'backend', 'frontend', 'database', 'websocket', 'rest', 'graphql',
+                            'python', 'rust', 'typescript', 'solana', 'anchor']),
+    "agentic": frozenset(['autonomous', 'agent', 'ai', 'llm', 'reasoning', 'planning',
+                          'self-', 'memory', 'decision', 'cognitive', 'inference']),
+    "solana": frozenset(['solana', 'spl', 'anchor', 'wallet', 'transaction', 'devnet',
+                         'mainnet', 'memo program', 'on-chain', 'blockchain']),
+    "novelty": frozenset(['first', 'novel', 'new', 'innovative', 'unique', 'breakthrough',
+                          'revolutionary', 'pioneering']),
+    "spam": frozenset(['click here', 'buy now', 'limited time', 'act now', 'guaranteed',
+                       '!!!', 'free money', 'easy money']),
+    "forum_help": frozenset(['how to', 'help', 'question', 'issue', 'problem', 'advice',
+                             'suggestion', 'feedback', 'looking for']),
+    "forum_technical": frozenset(['solana', 'agent', 'autonomous', 'api', 'integration',
+                                  'transaction', 'smart contract', 'blockchain'])
+}
+
+# Project score categories in score_breakdown order, as (keyword category,
+# points per distinct keyword, base points); every score is capped at SCORE_CAP
+PROJECT_SCORING = (
+    ("technical", 1.5, 0),
+    ("agentic", 1.2, 0),
+    ("solana", 1.3, 0),
+    ("novelty", 2, 3),
+    ("spam", 2, 0)  # Lower is better
+)
+SCORE_CAP = 10
+
+# Vote eligibility: total score above VOTE_MIN_TOTAL and spam risk below VOTE_MAX_SPAM
+VOTE_MIN_TOTAL = 15
+VOTE_MAX_SPAM = 5
+
+# Scores are computed in integer tenths of a point, which is exact, so ranking
+# and thresholds need no rounding; values are converted back (_from_tenths)
+# only for the rows that are output
+_CAP_TENTHS = SCORE_CAP * 10
+_VOTE_MIN_TOTAL_TENTHS = VOTE_MIN_TOTAL * 10
+_VOTE_MAX_SPAM_TENTHS = VOTE_MAX_SPAM * 10
+
+# PROJECT_SCORING in tenths, with each category resolved to its keyword set
+_PROJECT_SCORING_SETS = tuple(
+    (KEYWORDS[category], round(weight * 10), base * 10)
+    for category, weight, base in PROJECT_SCORING
+)
+# Categories scored in whole points (integer weight and base)
+_WHOLE_POINT_CATEGORIES = tuple(
+    isinstance(weight, int) and isinstance(base, int) for _, weight, base in PROJECT_SCORING
+)
+
+def _from_tenths(tenths: int, whole_points: bool):
+    """
+    Output value of a score kept in tenths, typed as the point arithmetic
+    produced it: int for whole-point categories and for capped scores (the
+    cap is the int SCORE_CAP), float otherwise
+    """
+    if whole_points or tenths == _CAP_TENTHS:
+        return tenths // 10
+    return tenths / 10
+
+# Corpora at least this large are scored across worker processes, in chunks;
+# below it, process start-up and pickling cost more than they save
+PARALLEL_SCORING_THRESHOLD = 20000
+_SCORING_CHUNK_SIZE = 2048
+
+# Score rows cached across runs are keyed by a BLAKE2b digest of the scored
+# project fields, itself keyed by a fingerprint of the scoring rules so that
+# editing keywords or weights invalidates every cached row. Bump the version
+# when scoring logic changes in a way the tables do not capture.
+_SCORE_CACHE_VERSION = 1
+_SCORING_FINGERPRINT = hashlib.blake2b(repr((
+    _SCORE_CACHE_VERSION,
+    sorted((category, sorted(keywords)) for category, keywords in KEYWORDS.items()),
+    PROJECT_SCORING, SCORE_CAP
+)).encode(), digest_size=16).digest()
+
+def _score_cache_key(project: Dict[str, Any]) -> str:
+    """Cache key of a project's score row (every field scoring reads)"""
+    fields = (
+        project.get('description', ''), project.get('name', ''),
+        project.get('repoLink', ''), project.get('status')
+    )
+    return hashlib.blake2b(
+        json.dumps(fields).encode(), digest_size=16, key=_SCORING_FINGERPRINT
+    ).hexdigest()
+
+# Shelf key holding the fingerprint its rows were scored under
+_CACHE_FINGERPRINT_KEY = '__scoring_fingerprint__'
+
+# Sort keys for project scores and forum post entries
+_PROJECT_BY_TOTAL_SCORE = attrgetter('total_score')
+_BY_TOTAL_SCORE = itemgetter('total_score')
+
+@dataclass(slots=True)
+class Breakdown:
+    """Per-criterion project scores (0 to SCORE_CAP)"""
+    technical_depth: float
+    agentic_level: float
+    solana_integration: float
+    novelty: float
+    spam_risk: float  # Lower is better
+
+@dataclass(slots=True)
+class ProjectScore:
+    """Scored project; dataclasses.asdict gives the logged JSON shape"""
+    project_id: int
+    project_name: str
+    project_slug: Optional[str]
+    score_breakdown: Breakdown
+    total_score: float
+    human_upvotes: int
+    agent_upvotes: int
+    status: Optional[str]
+
+# Single-word keywords match whole tokens only (so 'rust' does not match
+# 'trusted'); phrases and punctuated keywords ('smart contract', 'self-',
+# 'on-chain', '!!!') match anywhere as substrings
+_ALL_KEYWORDS = set().union(*KEYWORDS.values())
+_WORD_KEYWORDS = frozenset(kw for kw in _ALL_KEYWORDS if kw.isalnum())
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# One scanner for every phrase, compiled once at import. Alternatives are tried
+# longest first, and the zero-width lookahead reports a match at each start
+# position, so overlapping phrases are found in a single pass
+_PHRASE_KEYWORDS = sorted(_ALL_KEYWORDS - _WORD_KEYWORDS, key=len, reverse=True)
+_KEYWORD_SCANNER = re.compile("(?=(%s))" % "|".join(map(re.escape, _PHRASE_KEYWORDS)))
+# Only the longest phrase is reported at a position; it also implies every
+# shorter phrase that is a prefix of it
+_KEYWORD_PREFIXES = {
+    kw: frozenset(k for k in _PHRASE_KEYWORDS if kw.startswith(k)) for kw in _PHRASE_KEYWORDS
+}
 
 class CommunityScorer:
-    def __init__(self):
+    # Maximum per criterion (shared, read-only)
+    scoring_criteria = {
+        "technical_depth": SCORE_CAP,
+        "agentic_level": SCORE_CAP,
+        "solana_integration": SCORE_CAP,
+        "novelty": SCORE_CAP,
+        "spam_risk": SCORE_CAP  # Lower is better
+    }
+    
+    def __init__(self, cache_path: Optional[str] = None):
         self.my_project_id = 282  # Don't vote for own project
-        self.scoring_criteria = {
-            "technical_depth": 10,
-            "agentic_level": 10,
-            "solana_integration": 10,
-            "novelty": 10,
-            "spam_risk": 10  # Lower is better
-        }
+        # Score rows persisted across runs (see _score_cache_key); upvotes and
+        # other display fields are always read from the current project
+        self._cache_path = cache_path
+        self._cache_used = set()
+        self._cache = None
+        if cache_path:
+            self._cache = shelve.open(cache_path)
+            if self._cache.get(_CACHE_FINGERPRINT_KEY) != _SCORING_FINGERPRINT:
+                self._reset_cache({})  # rows from other scoring rules are dead
+    
+    def _reset_cache(self, rows: Dict[str, Any]):
+        """Recreate the score cache file holding only the given rows"""
+        self._cache.close()
+        self._cache = shelve.open(self._cache_path, flag='n')
+        self._cache[_CACHE_FINGERPRINT_KEY] = _SCORING_FINGERPRINT
+        self._cache.update(rows)
+    
+    def prune_cache(self):
+        """Drop cached rows not used since the cache was opened (call after scoring the full corpus)"""
+        if self._cache is None or len(self._cache) - 1 == len(self._cache_used):
+            return
+        self._reset_cache({key: self._cache[key] for key in self._cache_used})
+    
+    def close(self):
+        """Close the score cache, if one is open"""
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+    
+    def find_keywords_each(self, texts: List[str]) -> List[set]:
+        """
+        Distinct keywords (any category) in each text, from one phrase scan over all of them
+        
+        The texts are packed into a single newline-joined buffer; no phrase
+        contains a newline, so no match spans two texts, and each match is
+        attributed to its text by start offset. Word keywords are looked up in
+        each text's token set.
+        """
+        ends = list(accumulate(len(text) + 1 for text in texts)) # past each separator
+        longest = [set() for _ in texts]
+        for match in _KEYWORD_SCANNER.finditer("\n".join(texts)):
+            longest[bisect_right(ends, match.start())].add(match.group(1))
+        return [
+            _WORD_KEYWORDS.intersection(_TOKEN_RE.findall(text)).union(
+                *(_KEYWORD_PREFIXES[kw] for kw in hits)
+            )
+            for text, hits in zip(texts, longest)
+        ]
     
-    def score_project(self, project: Dict[str, Any]) -> Dict[str, Any]:
+    def score_project(self, project: Dict[str, Any]) -> ProjectScore:
         """Score a project based on multiple criteria"""
-        description = project.get('description', '').lower()
-        name = project.get('name', '').lower()
-        repo_link = project.get('repoLink', '')
+        return self.score_projects([project])[0]
+    
+    def score_projects(self, projects: List[Dict[str, Any]]) -> List[ProjectScore]:
+        """Score a batch of projects, scanning every haystack before any scoring"""
+        return [
+            self._score_record(project, row)
+            for project, row in zip(projects, self._score_rows(projects))
+        ]
+    
+    def rank_projects(
+        self, projects: List[Dict[str, Any]], top_n: int = 10, max_votes: int = 5
+    ) -> Tuple[List[ProjectScore], List[Dict]]:
+        """
+        Top projects by score and the selection to vote for, in one pass
         
-        # Technical depth - look for technical keywords
-        technical_keywords = ['api', 'blockchain', 'smart contract', 'algorithm', 'architecture', 
-                             'backend', 'frontend', 'database', 'websocket', 'rest', 'graphql',
-                             'python', 'rust', 'typescript', 'solana', 'anchor']
-        technical_depth = min(10, sum(1 for kw in technical_keywords if kw in description) * 1.5)
+        Same results as ranking score_projects() output and calling
+        select_projects_to_vote on it, but projects are ranked on compact score
+        rows and only the winners are built into ProjectScores.
+        """
+        rows = self._score_rows(projects)
+        totals = [row[5] for row in rows] # tenths
+        top = heapq.nlargest(top_n, range(len(rows)), key=totals.__getitem__)
+        eligible = [
+            i for i, row in enumerate(rows)
+            if (projects[i]['id'] != self.my_project_id and
+                row[5] > _VOTE_MIN_TOTAL_TENTHS and
+                row[4] < _VOTE_MAX_SPAM_TENTHS)
+        ]
+        voted = heapq.nlargest(max_votes, eligible, key=totals.__getitem__)
         
-        # Agentic level - look for autonomous agent keywords
-        agentic_keywords = ['autonomous', 'agent', 'ai', 'llm', 'reasoning', 'planning', 
-                           'self-', 'memory', 'decision', 'cognitive', 'inference']
-        agentic_level = min(10, sum(1 for kw in agentic_keywords if kw in description) * 1.2)
+        records = {i: self._score_record(projects[i], rows[i]) for i in {*top, *voted}}
+        return [records[i] for i in top], [self._vote_entry(records[i]) for i in voted]
+    
+    def _score_rows(self, projects: List[Dict[str, Any]]) -> List[tuple]:
+        """(technical, agentic, solana, novelty, spam, total) per project, in tenths"""
+        if self._cache is None:
+            return self._compute_rows(projects)
         
-        # Solana integration - look for Solana-specific terms
-        solana_keywords = ['solana', 'spl', 'anchor', 'wallet', 'transaction', 'devnet', 
-                          'mainnet', 'memo program', 'on-chain', 'blockchain']
-        solana_integration = min(10, sum(1 for kw in solana_keywords if kw in description) * 1.3)
+        # Only projects whose scored fields changed since a cached run are scored
+        keys = [_score_cache_key(project) for project in projects]
+        self._cache_used.update(keys)
+        rows = [self._cache.get(key) for key in keys]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        if missing:
+            for i, row in zip(missing, self._compute_rows([projects[i] for i in missing])):
+                rows[i] = row
+                self._cache[keys[i]] = row
+        return rows
+    
+    def _compute_rows(self, projects: List[Dict[str, Any]]) -> List[tuple]:
+        """_score_rows without the cache"""
+        workers = os.cpu_count() or 1
+        if len(projects) < PARALLEL_SCORING_THRESHOLD or workers < 2:
+            return self._score_rows_serial(projects)
         
-        # Novelty - unique concepts
-        novelty_keywords = ['first', 'novel', 'new', 'innovative', 'unique', 'breakthrough',
-                           'revolutionary', 'pioneering']
-        novelty = min(10, sum(1 for kw in novelty_keywords if kw in description) * 2 + 3)
+        # Scoring keeps no state across projects, so chunks score independently
+        chunks = [
+            projects[i:i + _SCORING_CHUNK_SIZE]
+            for i in range(0, len(projects), _SCORING_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(chain.from_iterable(executor.map(_score_chunk, chunks)))
+    
+    def _score_rows_serial(self, projects: List[Dict[str, Any]]) -> List[tuple]:
+        """_score_rows in this process"""
+        # Description and name are searched together, lowercased in one go; the
+        # newline keeps phrases from matching across the boundary
+        haystacks = [
+            (project.get('description', '') + "\n" + project.get('name', '')).lower()
+            for project in projects
+        ]
+        found_per_project = self.find_keywords_each(haystacks)
+        return [
+            self._score_from_keywords(project, found)
+            for project, found in zip(projects, found_per_project)
+        ]
+    
+    def _score_from_keywords(self, project: Dict[str, Any], found: set) -> tuple:
+        """Score row of one project from the keywords found in its haystack"""
+        repo_link = project.get('repoLink', '')
         
-        # Spam risk - check for spam indicators
-        spam_indicators = ['click here', 'buy now', 'limited time', 'act now', 'guaranteed',
-                          '!!!', 'free money', 'easy money']
-        spam_risk = min(10, sum(2 for si in spam_indicators if si in description))
+        # Technical depth, agentic level, Solana integration, novelty (unique
+        # concepts) and spam risk: weighted keyword hits plus base, capped
+        technical_depth, agentic_level, solana_integration, novelty, spam_risk = [
+            min(_CAP_TENTHS, len(found & keywords) * weight + base)
+            for keywords, weight, base in _PROJECT_SCORING_SETS
+        ]
         
         # Bonus for having repo link
         if repo_link and 'github.com' in repo_link:
-            technical_depth = min(10, technical_depth + 1)
+            technical_depth = min(_CAP_TENTHS, technical_depth + 10)
         
         # Bonus for submitted status
         if project.get('status') == 'submitted':
-            technical_depth = min(10, technical_depth + 0.5)
+            technical_depth = min(_CAP_TENTHS, technical_depth + 5)
         
         total_score = (technical_depth + agentic_level + solana_integration + novelty - spam_risk)
         
-        return {
-            "project_id": project['id'],
-            "project_name": project['name'],
-            "project_slug": project.get('slug'),
-            "score_breakdown": {
-                "technical_depth": round(technical_depth, 1),
-                "agentic_level": round(agentic_level, 1),
-                "solana_integration": round(solana_integration, 1),
-                "novelty": round(novelty, 1),
-                "spam_risk": round(spam_risk, 1)
-            },
-            "total_score": round(total_score, 1),
-            "human_upvotes": project.get('humanUpvotes', 0),
-            "agent_upvotes": project.get('agentUpvotes', 0),
-            "status": project.get('status')
-        }
+        return (technical_depth, agentic_level, solana_integration, novelty, spam_risk, total_score)
+    
+    def _score_record(self, project: Dict[str, Any], row: tuple) -> ProjectScore:
+        """ProjectScore for a project and its score row"""
+        breakdown = [
+            _from_tenths(tenths, whole_points)
+            for tenths, whole_points in zip(row, _WHOLE_POINT_CATEGORIES)
+        ]
+        # The total is an int exactly when every breakdown value is
+        total = row[5]
+        total = total // 10 if all(isinstance(value, int) for value in breakdown) else total / 10
+        return ProjectScore(
+            project_id=project['id'],
+            project_name=project['name'],
+            project_slug=project.get('slug'),
+            score_breakdown=Breakdown(*breakdown),
+            total_score=total,
+            human_upvotes=project.get('humanUpvotes', 0),
+            agent_upvotes=project.get('agentUpvotes', 0),
+            status=project.get('status')
+        )
     
-    def select_projects_to_vote(self, scored_projects: List[Dict], max_votes: int = 5) -> List[Dict]:
+    def select_projects_to_vote(self, scored_projects: List[ProjectScore], max_votes: int = 5) -> List[Dict]:
         """Select top projects to vote for"""
-        # Filter out own project
-        candidates = [p for p in scored_projects if p['project_id'] != self.my_project_id]
-        
-        # Sort by total score
-        candidates.sort(key=lambda x: x['total_score'], reverse=True)
+        # Filter out own project; keep projects above the vote thresholds
+        candidates = [
+            p for p in scored_projects
+            if (p.project_id != self.my_project_id and
+                p.total_score > VOTE_MIN_TOTAL and
+                p.score_breakdown.spam_risk < VOTE_MAX_SPAM)
+        ]
         
-        # Select top projects with score > 15 and spam_risk < 5
-        selected = []
-        for project in candidates:
-            if len(selected) >= max_votes:
-                break
-            if (project['total_score'] > 15 and 
-                project['score_breakdown']['spam_risk'] < 5):
-                selected.append({
-                    "project_id": project['project_id'],
-                    "project_name": project['project_name'],
-                    "project_slug": project['project_slug'],
-                    "total_score": project['total_score'],
-                    "reason": self._generate_vote_reason(project)
-                })
-        
-        return selected
+        # Top projects by total score (same order as a stable descending sort)
+        return [
+            self._vote_entry(project)
+            for project in heapq.nlargest(max_votes, candidates, key=_PROJECT_BY_TOTAL_SCORE)
+        ]
+    
+    def _vote_entry(self, project: ProjectScore) -> Dict:
+        """Voting selection entry for a scored project"""
+        return {
+            "project_id": project.project_id,
+            "project_name": project.project_name,
+            "project_slug": project.project_slug,
+            "total_score": project.total_score,
+            "reason": self._generate_vote_reason(project)
+        }
     
-    def _generate_vote_reason(self, project: Dict) -> str:
+    def _generate_vote_reason(self, project: ProjectScore) -> str:
         """Generate a concise reason for voting"""
-        scores = project['score_breakdown']
+        scores = project.score_breakdown
         reasons = []
         
-        if scores['agentic_level'] >= 7:
+        if scores.agentic_level >= 7:
             reasons.append("strong autonomous capabilities")
-        if scores['solana_integration'] >= 7:
+        if scores.solana_integration >= 7:
             reasons.append("solid Solana integration")
-        if scores['technical_depth'] >= 7:
+        if scores.technical_depth >= 7:
             reasons.append("high technical depth")
-        if scores['novelty'] >= 7:
+        if scores.novelty >= 7:
             reasons.append("novel approach")
         
         return " + ".join(reasons) if reasons else "well-rounded project"
@@ -124,18 +385,16 @@ class CommunityScorer:
         """Analyze forum posts for potential comments"""
         valuable_posts = []
         
-        for post in posts:
-            content = post.get('content', '').lower()
-            title = post.get('title', '').lower()
-            
+        # Title and content are searched together, lowercased in one go; all
+        # posts are scanned in a single pass
+        haystacks = [
+            (post.get('title', '') + "\n" + post.get('content', '')).lower()
+            for post in posts
+        ]
+        for post, found in zip(posts, self.find_keywords_each(haystacks)):
             # Look for posts asking for help or discussing technical topics
-            help_keywords = ['how to', 'help', 'question', 'issue', 'problem', 'advice',
-                           'suggestion', 'feedback', 'looking for']
-            technical_keywords = ['solana', 'agent', 'autonomous', 'api', 'integration',
-                                'transaction', 'smart contract', 'blockchain']
-            
-            help_score = sum(1 for kw in help_keywords if kw in content or kw in title)
-            tech_score = sum(1 for kw in technical_keywords if kw in content or kw in title)
+            help_score = len(found & KEYWORDS["forum_help"])
+            tech_score = len(found & KEYWORDS["forum_technical"])
             
             if help_score > 0 or tech_score > 2:
                 valuable_posts.append({
@@ -147,18 +406,23 @@ class CommunityScorer:
                     "tags": post.get('tags', [])
                 })
         
-        # Sort by total score
-        valuable_posts.sort(key=lambda x: x['total_score'], reverse=True)
-        return valuable_posts[:5]  # Top 5 posts
+        # Top 5 posts by total score
+        return heapq.nlargest(5, valuable_posts, key=_BY_TOTAL_SCORE)
+
+
+def _score_chunk(projects: List[Dict[str, Any]]) -> List[tuple]:
+    """Score rows for one chunk of projects (worker process entry point)"""
+    return CommunityScorer()._score_rows_serial(projects)
 
 
 def main():
-    scorer = CommunityScorer()
+    scorer = CommunityScorer(cache_path='logs/score_cache.db')
     
     # Load projects
-    with open('logs/projects_current.json') as f:
-        projects_data = json.load(f)
-        projects = projects_data['projects']
+    with open('logs/projects_current.json', 'rb') as f:
+        raw = f.read()
+    projects_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    projects = projects_data['projects']
     
     print("=" * 80)
     print("  COMMUNITY ENGAGEMENT - PROJECT SCORING")
@@ -166,32 +430,28 @@ def main():
     print(f"\nTotal projects found: {len(projects)}")
     print(f"Excluding own project ID: {scorer.my_project_id}\n")
     
-    # Score all projects
-    scored_projects = []
-    for project in projects:
-        score = scorer.score_project(project)
-        scored_projects.append(score)
-    
-    # Sort by total score
-    scored_projects.sort(key=lambda x: x['total_score'], reverse=True)
+    # Score all projects; only the top 10 and the vote selection are materialized
+    try:
+        top_projects, selected_for_voting = scorer.rank_projects(projects, top_n=10, max_votes=5)
+        scorer.prune_cache()
+    finally:
+        scorer.close()
     
     # Display top 10
     print("TOP 10 PROJECTS BY SCORE:")
     print("-" * 80)
-    for i, project in enumerate(scored_projects[:10], 1):
-        print(f"{i}. {project['project_name']} (ID: {project['project_id']})")
-        print(f"   Total Score: {project['total_score']}")
-        print(f"   Breakdown: Tech={project['score_breakdown']['technical_depth']}, "
-              f"Agentic={project['score_breakdown']['agentic_level']}, "
-              f"Solana={project['score_breakdown']['solana_integration']}, "
-              f"Novelty={project['score_breakdown']['novelty']}, "
-              f"Spam={project['score_breakdown']['spam_risk']}")
-        print(f"   Votes: {project['human_upvotes']} human, {project['agent_upvotes']} agent")
+    for i, project in enumerate(top_projects, 1):
+        breakdown = project.score_breakdown
+        print(f"{i}. {project.project_name} (ID: {project.project_id})")
+        print(f"   Total Score: {project.total_score}")
+        print(f"   Breakdown: Tech={breakdown.technical_depth}, "
+              f"Agentic={breakdown.agentic_level}, "
+              f"Solana={breakdown.solana_integration}, "
+              f"Novelty={breakdown.novelty}, "
+              f"Spam={breakdown.spam_risk}")
+        print(f"   Votes: {project.human_upvotes} human, {project.agent_upvotes} agent")
         print()
     
-    # Select projects to vote
-    selected_for_voting = scorer.select_projects_to_vote(scored_projects, max_votes=5)
-    
     print("=" * 80)
     print("  SELECTED FOR VOTING")
     print("=" * 80)
@@ -205,12 +465,17 @@ def main():
     results = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "total_projects_analyzed": len(projects),
-        "top_10_projects": scored_projects[:10],
+        "top_10_projects": [asdict(project) for project in top_projects],
         "selected_for_voting": selected_for_voting
     }
     
-    with open('logs/community_analysis.log', 'w') as f:
-        json.dump(results, f, indent=2)
+    # Serialized in one piece (UTF-8, 2-space indent) and written with a single write
+    if orjson is not None:
+        payload = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(results, indent=2, ensure_ascii=False).encode()
+    with open('logs/community_analysis.log', 'wb', buffering=1 << 20) as f:
+        f.write(payload)
     
     print("✓ Analysis saved to logs/community_analysis.log")
     